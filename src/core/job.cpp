@@ -21,6 +21,37 @@ QPDFJob job_from_json_str(const std::string &json)
     return job;
 }
 
+QPDFJob job_from_json_dict(py::dict &json_dict)
+{
+    // Common jobs that only name an input and output file can be configured
+    // directly, without encoding the dict to JSON and having qpdf parse it
+    // back. Anything else takes the JSON path so qpdf validates it.
+    bool simple = !json_dict.empty();
+    for (auto item : json_dict) {
+        auto key = py::str(item.first).cast<std::string>();
+        if ((key != "inputFile" && key != "outputFile") ||
+            !py::isinstance<py::str>(item.second)) {
+            simple = false;
+            break;
+        }
+    }
+    if (!simple) {
+        auto json_dumps  = py::module_::import("json").attr("dumps");
+        py::str json_str = json_dumps(json_dict);
+        return job_from_json_str(std::string(json_str));
+    }
+
+    QPDFJob job;
+    auto config = job.config();
+    if (json_dict.contains("inputFile"))
+        config->inputFile(json_dict["inputFile"].cast<std::string>());
+    if (json_dict.contains("outputFile"))
+        config->outputFile(json_dict["outputFile"].cast<std::string>());
+    config->checkConfiguration();
+    set_job_defaults(job);
+    return job;
+}
+
 void init_job(py::module_ &m)
 {
     py::class_<QPDFJob>(m, "Job")
@@ -45,12 +76,7 @@ void init_job(py::module_ &m)
         .def(py::init(&job_from_json_str),
             py::arg("json") // LCOV_EXCL_LINE
             )
-        .def(py::init([](py::dict &json_dict) {
-            auto json_dumps  = py::module_::import("json").attr("dumps");
-            py::str json_str = json_dumps(json_dict);
-            return job_from_json_str(std::string(json_str));
-        }),
-            py::arg("json_dict"))
+        .def(py::init(&job_from_json_dict), py::arg("json_dict"))
         .def(py::init(
                  [](const std::vector<std::string> &args, std::string const &progname) {
                      QPDFJob job;
@@ -2,6 +2,7 @@
 // SPDX-License-Identifier: MPL-2.0
 
 #include <cmath>
+#include <cstdint>
 
 #include <qpdf/Constants.h>
 #include <qpdf/Types.h>
@@ -163,16 +164,40 @@ void init_matrix(py::module_ &m)
             },
             py::arg("dtype") = py::none(),
             py::arg("copy")  = py::none())
+        .def_property_readonly("__array_interface__",
+            [](QPDFMatrix const &self) {
+                // numpy prefers this to __array__, and can copy the 3x3
+                // augmented matrix straight out of a buffer rather than
+                // discovering the shape of nested tuples of Python floats.
+                // A bytearray keeps arrays from np.asarray() writable and
+                // independent of the Matrix, as they were with __array__.
+                const double values[9] = {
+                    // clang-format off
+                    self.a, self.b, 0,
+                    self.c, self.d, 0,
+                    self.e, self.f, 1
+                    // clang-format on
+                };
+                const uint16_t probe     = 1;
+                const bool little_endian = *reinterpret_cast<const char *>(&probe) == 1;
+                py::dict interface;
+                interface["shape"]   = py::make_tuple(3, 3);
+                interface["typestr"] = little_endian ? "<f8" : ">f8";
+                interface["data"]    = py::bytearray(
+                    reinterpret_cast<const char *>(values), sizeof(values));
+                interface["version"] = 3;
+                return interface;
+            })
         .def("as_array",
             [](QPDFMatrix const &self) { return QPDFObjectHandle::newArray(self); })
         .def(
             "transform",
-            [](QPDFMatrix const &self, Point const &point) {
-                double x = point.first;
-                double y = point.second;
-                double xp, yp;
-                self.transform(x, y, xp, yp);
-                return py::make_tuple(xp, yp);
+            [](QPDFMatrix const &self, Point const &point) -> Point {
+                // Registered before the Rectangle overload so that the
+                // common case of a point matches first
+                auto [x, y] = point;
+                return {
+                    self.a * x + self.c * y + self.e, self.b * x + self.d * y + self.f};
             },
             py::arg("point"))
         .def(
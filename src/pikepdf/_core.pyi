@@ -2706,6 +2706,13 @@ class Matrix:
 
         If numpy is not installed, this will throw an exception.
         """
+    @property
+    def __array_interface__(self) -> dict[str, Any]:
+        """Describe this matrix to NumPy as a 3x3 array of float64.
+
+        This lets ``numpy.asarray(matrix)`` read the values from a buffer
+        without going through Python floats.
+        """
     def as_array(self) -> Array:
         """Convert this matrix to a pikepdf.Array.
 
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import datetime
 import mimetypes
+import os
 import shutil
 from collections.abc import ItemsView, Iterator, KeysView, MutableMapping, ValuesView
 from contextlib import ExitStack, suppress
@@ -65,6 +66,10 @@ def _single_page_pdf(page: Page) -> bytes:
     return bio.read()
 
 
+# Linux can hand mutool an anonymous in-memory file to write its output to
+_MUDRAW_USE_MEMFD = hasattr(os, 'memfd_create') and os.path.isdir('/proc/self/fd')
+
+
 def _mudraw(buffer, fmt) -> bytes:
     """Use mupdf draw to rasterize the PDF in the memory buffer."""
     # mudraw cannot read from stdin so NamedTemporaryFile is required
@@ -73,12 +78,36 @@ def _mudraw(buffer, fmt) -> bytes:
         tmp_in.seek(0)
         tmp_in.flush()
 
-        proc = run(
-            ['mutool', 'draw', '-F', fmt, '-o', '-', tmp_in.name],
-            capture_output=True,
-            check=True,
-        )
-        return proc.stdout
+        # Both branches below use an absolute program path, close_fds=False
+        # and no pass_fds, so CPython starts mutool with posix_spawn instead
+        # of forking the whole process. Python-created file descriptors are
+        # non-inheritable by default, so only the output memfd, where used,
+        # reaches the child.
+        mutool = shutil.which('mutool') or 'mutool'
+        if not _MUDRAW_USE_MEMFD:
+            proc = run(
+                [mutool, 'draw', '-F', fmt, '-o', '-', tmp_in.name],
+                capture_output=True,
+                check=True,
+                close_fds=False,
+            )
+            return proc.stdout
+
+        # Have mutool write directly into shared memory, rather than copying
+        # a potentially large image through a pipe. The memfd is created
+        # inheritable (no MFD_CLOEXEC) because pass_fds would rule out
+        # posix_spawn just as close_fds=True does.
+        fd = os.memfd_create('pikepdf-mudraw', 0)
+        try:
+            run(
+                [mutool, 'draw', '-F', fmt, '-o', f'/proc/self/fd/{fd}', tmp_in.name],
+                capture_output=True,
+                check=True,
+                close_fds=False,
+            )
+            return os.pread(fd, os.fstat(fd).st_size, 0)
+        finally:
+            os.close(fd)
 
 
 @augments(Object)
@@ -11,7 +11,11 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cached_property
+from hashlib import blake2b
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, CalledProcessError, run
 from tempfile import TemporaryDirectory
@@ -53,19 +57,73 @@ class JBIG2DecoderInterface(ABC):
 class JBIG2Decoder(JBIG2DecoderInterface):
     """JBIG2 decoder implementation."""
 
-    def __init__(self, *, subprocess_run=run, creationflags=CREATION_FLAGS):
-        """Initialize the decoder."""
+    def __init__(
+        self,
+        *,
+        subprocess_run=run,
+        creationflags=CREATION_FLAGS,
+        cache_size: int = 0,
+    ):
+        """Initialize the decoder.
+
+        Args:
+            subprocess_run: Function used to run jbig2dec.
+            creationflags: Process creation flags passed to ``subprocess_run``.
+            cache_size: Number of recently decoded images to keep, so that
+                decoding the same image again does not run jbig2dec again.
+                Decoded pages can be several megabytes each, so caching is
+                off (0) by default.
+        """
         self._run = subprocess_run
         self._creationflags = creationflags
+        self._cache_size = cache_size
+        self._cache: OrderedDict[bytes, bytes] = OrderedDict()
+        # The default decoder is shared by every thread in the process
+        self._cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Discard all cached decoded images."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def check_available(self) -> None:
         """Check if jbig2dec is installed and usable."""
-        version = self._version()
+        version = self._installed_version
         if version is not None and version < Version('0.15'):
             raise DependencyError("jbig2dec is too old (older than version 0.15)")
 
     def decode_jbig2(self, jbig2: bytes, jbig2_globals: bytes) -> bytes:
         """Decode JBIG2 from binary data, returning decode bytes."""
+        if self._cache_size <= 0:
+            return self._decode_jbig2(jbig2, jbig2_globals)
+
+        key = self._cache_key(jbig2, jbig2_globals)
+        with self._cache_lock:
+            decoded = self._cache.get(key)
+            if decoded is not None:
+                self._cache.move_to_end(key)
+                return decoded
+
+        # Decode without holding the lock, so other threads are not blocked
+        # on jbig2dec
+        decoded = self._decode_jbig2(jbig2, jbig2_globals)
+        with self._cache_lock:
+            self._cache[key] = decoded
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return decoded
+
+    @staticmethod
+    def _cache_key(jbig2: bytes, jbig2_globals: bytes) -> bytes:
+        h = blake2b(digest_size=16)
+        # Prefix the globals with their length so that different splits of
+        # the same bytes between globals and image data hash differently
+        h.update(len(jbig2_globals).to_bytes(8, 'little'))
+        h.update(jbig2_globals)
+        h.update(jbig2)
+        return h.digest()
+
+    def _decode_jbig2(self, jbig2: bytes, jbig2_globals: bytes) -> bytes:
         with TemporaryDirectory(prefix='pikepdf-', suffix='.jbig2') as tmpdir:
             image_path = Path(tmpdir) / "image"
             global_path = Path(tmpdir) / "global"
@@ -98,6 +156,13 @@ class JBIG2Decoder(JBIG2DecoderInterface):
             with Image.open(output_path) as im:
                 return im.tobytes()
 
+    @cached_property
+    def _installed_version(self) -> Version | None:
+        # check_available() runs before every JBIG2 decode, so only ask
+        # jbig2dec for its version once. A failed probe raises and is not
+        # cached, so installing jbig2dec later is still noticed.
+        return self._version()
+
     def _version(self) -> Version | None:
         try:
             proc = self._run(
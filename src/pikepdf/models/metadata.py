@@ -8,9 +8,9 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, MutableMapping
-from datetime import datetime, timezone
-from functools import wraps
+from collections.abc import Container, Iterable, Iterator, MutableMapping
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 from warnings import warn
@@ -118,6 +118,16 @@ LANG_ALTS = frozenset(
     ]
 )
 
+# Overwritten on save when pikepdf marks itself as the editor
+PIKEPDF_MARK_KEYS = frozenset(
+    [
+        str(QName(XMP_NS_XMP, 'MetadataDate')),
+        str(QName(XMP_NS_PDF, 'Producer')),
+    ]
+)
+
+DC_CREATOR = str(QName(XMP_NS_DC, 'creator'))
+
 # These are the illegal characters in XML 1.0. (XML 1.1 is a bit more permissive,
 # but we'll be strict to ensure wider compatibility.)
 re_xml_illegal_chars = re.compile(
@@ -198,6 +208,38 @@ def encode_pdf_date(d: datetime) -> str:
     return s
 
 
+def _decode_fixed_width_date(t: str) -> datetime:
+    """Decode YYYYMMDD, YYYYMMDDHHmmSS or YYYYMMDDHHmmSS+HHmm.
+
+    Raises ValueError for anything else, including invalid field values.
+    """
+    if not (t.isascii() and t[:8].isdigit()):
+        raise ValueError(t)
+    if len(t) == 8:
+        return datetime(int(t[0:4]), int(t[4:6]), int(t[6:8]))
+    if not t[8:14].isdigit():
+        raise ValueError(t)
+    fields = (
+        int(t[0:4]),
+        int(t[4:6]),
+        int(t[6:8]),
+        int(t[8:10]),
+        int(t[10:12]),
+        int(t[12:14]),
+    )
+    if len(t) == 14:
+        return datetime(*fields)
+    if len(t) != 19 or t[14] not in '+-' or not t[15:19].isdigit():
+        raise ValueError(t)
+    hours, minutes = int(t[15:17]), int(t[17:19])
+    if minutes >= 60:
+        raise ValueError(t)
+    offset = timedelta(hours=hours, minutes=minutes)
+    if t[14] == '-':
+        offset = -offset
+    return datetime(*fields, tzinfo=timezone(offset))
+
+
 def decode_pdf_date(s: str) -> datetime:
     """Decode a pdfmark date to a Python datetime object.
 
@@ -220,6 +262,13 @@ def decode_pdf_date(s: str) -> datetime:
             break
     t = t.replace("'", "")  # Remove apos from PDF time strings
 
+    # Nearly all dates are fixed width, so slice out the fields directly, and
+    # only hand anything unusual to the much slower strptime
+    try:
+        return _decode_fixed_width_date(t)
+    except ValueError:
+        pass
+
     date_formats = [
         r"%Y%m%d%H%M%S%z",  # Format with timezone
         r"%Y%m%d%H%M%S",  # Format without timezone
@@ -374,7 +423,10 @@ class PdfMetadata(MutableMapping):
         """
         cls.NS[prefix] = uri
         cls.REVERSE_NS[uri] = prefix
-        etree.register_namespace(_prefix, _uri)
+        etree.register_namespace(prefix, uri)
+        # Names resolved against the old namespaces are no longer valid
+        cls._qname.cache_clear()
+        cls._prefix_from_uri.cache_clear()
 
     def __init__(
         self,
@@ -390,6 +442,7 @@ class PdfMetadata(MutableMapping):
         self._updating = False
         self.overwrite_invalid_xml = overwrite_invalid_xml
         self._xmp = None
+        self._xml_bytes: bytes | None = None
 
     def load_from_docinfo(
         self, docinfo, delete_missing: bool = False, raise_failure: bool = False
@@ -451,6 +504,7 @@ class PdfMetadata(MutableMapping):
         self._load_from(data)
 
     def _load_from(self, data: bytes) -> None:
+        self._xml_bytes = None
         if data.strip() == b'':
             data = XMP_EMPTY  # on some platforms lxml chokes on empty documents
 
@@ -514,10 +568,13 @@ class PdfMetadata(MutableMapping):
         """
         # Touch object to ensure it exists
         self._pdf.docinfo  # pylint: disable=pointless-statement
-        for uri, element, docinfo_name, converter in self.DOCINFO_MAPPING:
-            qname = QName(uri, element)
+        # Collect every mapped value in one walk of the XMP, rather than
+        # searching the XMP again for each DocumentInfo key
+        qnames = [QName(uri, element) for uri, element, _, _ in self.DOCINFO_MAPPING]
+        values = self._get_first_values({str(qname) for qname in qnames})
+        for qname, (_, _, docinfo_name, converter) in zip(qnames, self.DOCINFO_MAPPING):
             try:
-                value = self[qname]
+                value = values[str(qname)]
             except KeyError:
                 if docinfo_name in self._pdf.docinfo:
                     del self._pdf.docinfo[docinfo_name]
@@ -549,15 +606,15 @@ class PdfMetadata(MutableMapping):
                 self._pdf.docinfo[docinfo_name] = value
 
     def _get_xml_bytes(self, xpacket=True):
-        data = BytesIO()
-        if xpacket:
-            data.write(XPACKET_BEGIN)
-        self._xmp.write(data, encoding='utf-8', pretty_print=True)
+        # Serializing walks the whole tree, so keep the result until the tree
+        # is modified by _setitem, __delitem__ or _load_from
+        if self._xml_bytes is None:
+            data = BytesIO()
+            self._xmp.write(data, encoding='utf-8', pretty_print=True)
+            self._xml_bytes = data.getvalue()
         if xpacket:
-            data.write(XPACKET_END)
-        data.seek(0)
-        xml_bytes = data.read()
-        return xml_bytes
+            return XPACKET_BEGIN + self._xml_bytes + XPACKET_END
+        return self._xml_bytes
 
     def _apply_changes(self):
         """Serialize our changes back to the PDF in memory.
@@ -584,10 +641,14 @@ class PdfMetadata(MutableMapping):
             self._update_docinfo()
 
     @classmethod
+    @lru_cache(maxsize=256)
     def _qname(cls, name: QName | str) -> str:
         """Convert name to an XML QName.
 
         e.g. pdf:Producer -> {http://ns.adobe.com/pdf/1.3/}Producer
+
+        Results are cached, since the same handful of names are resolved on
+        nearly every access.
         """
         if isinstance(name, QName):
             return str(name)
@@ -613,14 +674,16 @@ class PdfMetadata(MutableMapping):
         uri = cls.NS.get(prefix, None)
         return str(QName(uri, tag))
 
-    def _prefix_from_uri(self, uriname):
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _prefix_from_uri(cls, uriname):
         """Given a fully qualified XML name, find a prefix.
 
         e.g. {http://ns.adobe.com/pdf/1.3/}Producer -> pdf:Producer
         """
         uripart, tag = uriname.split('}', maxsplit=1)
         uri = uripart.replace('{', '')
-        return self.REVERSE_NS[uri] + ':' + tag
+        return cls.REVERSE_NS[uri] + ':' + tag
 
     def _get_subelements(self, node: _Element) -> Any:
         """Gather the sub-elements attached to a node.
@@ -697,6 +760,28 @@ class PdfMetadata(MutableMapping):
                 values = self._get_subelements(node)
                 yield (node, None, values, rdfdesc)
 
+    def _get_first_values(self, qnames: Container[str]) -> dict[str, Any]:
+        """Get the first value of each of several properties from XMP.
+
+        Equivalent to looking up ``self[qname]`` for each of qnames, but visits
+        each rdf:Description once no matter how many names are wanted. Names
+        that are not present are omitted from the result.
+        """
+        found: dict[str, Any] = {}
+        rdf = self._get_rdf_root()
+        for rdfdesc in rdf.findall('rdf:Description[@rdf:about=""]', self.NS):
+            for k, v in rdfdesc.items():
+                if k in qnames and k not in found:
+                    found[k] = v
+            for node in rdfdesc.findall('*'):
+                if node.tag not in qnames or node.tag in found:
+                    continue
+                if node.text and node.text.strip():
+                    found[node.tag] = node.text
+                else:
+                    found[node.tag] = self._get_subelements(node)
+        return found
+
     def _get_element_values(self, name: str | QName = '') -> Iterator[Any]:
         yield from (v[2] for v in self._get_elements(name))
 
@@ -736,6 +821,7 @@ class PdfMetadata(MutableMapping):
         if not self._updating:
             raise RuntimeError("Metadata not opened for editing, use with block")
 
+        self._xml_bytes = None
         qkey = self._qname(key)
         self._setitem_check_args(key, val, applying_mark, qkey)
 
@@ -747,15 +833,7 @@ class PdfMetadata(MutableMapping):
             self._setitem_insert(key, val)
 
     def _setitem_check_args(self, key, val, applying_mark: bool, qkey: str) -> None:
-        if (
-            self.mark
-            and not applying_mark
-            and qkey
-            in (
-                self._qname('xmp:MetadataDate'),
-                self._qname('pdf:Producer'),
-            )
-        ):
+        if self.mark and not applying_mark and qkey in PIKEPDF_MARK_KEYS:
             # Complain if user writes self[pdf:Producer] = ... and because it will
             # be overwritten on save, unless self._updating_mark, in which case
             # the action was initiated internally
@@ -763,7 +841,7 @@ class PdfMetadata(MutableMapping):
                 f"Update to {key} will be overwritten because metadata was opened "
                 "with set_pikepdf_as_editor=True"
             )
-        if isinstance(val, str) and qkey in (self._qname('dc:creator')):
+        if isinstance(val, str) and qkey == DC_CREATOR:
             log.error(f"{key} should be set to a list of strings")
 
     def _setitem_add_array(self, node, items: Iterable) -> None:
@@ -787,7 +865,7 @@ class PdfMetadata(MutableMapping):
         node, attrib, _oldval, _parent = next(self._get_elements(key))
         if attrib:
             if not isinstance(val, str):
-                if qkey == self._qname('dc:creator'):
+                if qkey == DC_CREATOR:
                     # dc:creator incorrectly created as an attribute - we're
                     # replacing it anyway, so remove the old one
                     del node.attrib[qkey]
@@ -845,6 +923,7 @@ class PdfMetadata(MutableMapping):
         """Delete item from XMP metadata."""
         if not self._updating:
             raise RuntimeError("Metadata not opened for editing, use with block")
+        self._xml_bytes = None
         try:
             node, attrib, _oldval, parent = next(self._get_elements(key))
             if attrib:  # Inline
@@ -12,7 +12,17 @@ from itertools import chain
 from typing import cast
 
 from pikepdf._core import Page, Pdf
-from pikepdf.objects import Array, Dictionary, Name, Object, String
+from pikepdf.objects import Array, Dictionary, Name, String
+
+# Keys looked up on every outline node. Name.X builds a new Name on each
+# access, so these are resolved once.
+_A = Name.A
+_COUNT = Name.Count
+_DEST = Name.Dest
+_FIRST = Name.First
+_LAST = Name.Last
+_NEXT = Name.Next
+_PREV = Name.Prev
 
 
 class PageLocation(Enum):
@@ -37,6 +47,7 @@ PAGE_LOCATION_ARGS = {
     PageLocation.FitBV: ('left',),
 }
 ALL_PAGE_LOCATION_KWARGS = set(chain.from_iterable(PAGE_LOCATION_ARGS.values()))
+_PAGE_LOCATION_NAMES = {loc: Name(f'/{loc.name}') for loc in PageLocation}
 
 
 def make_page_destination(
@@ -89,16 +100,14 @@ def _make_page_destination(
     if page_location:
         if isinstance(page_location, PageLocation):
             loc_key = page_location
-            loc_str = loc_key.name
         else:
-            loc_str = page_location
             try:
-                loc_key = PageLocation[loc_str]
+                loc_key = PageLocation[page_location]
             except KeyError:
                 raise ValueError(
-                    f"Invalid or unsupported page location type {loc_str}"
+                    f"Invalid or unsupported page location type {page_location}"
                 ) from None
-        res.append(Name(f'/{loc_str}'))
+        res.append(_PAGE_LOCATION_NAMES[loc_key])
         dest_arg_names = PAGE_LOCATION_ARGS.get(loc_key)
         if dest_arg_names:
             res.extend(kwargs.get(k, 0) for k in dest_arg_names)
@@ -138,12 +147,29 @@ class OutlineItem:
     This object does not contain any information about higher-level or
     neighboring elements.
 
+    Only the attributes above, ``is_closed`` and ``children`` may be set;
+    assigning any other attribute raises ``AttributeError``. Items can be
+    weakly referenced.
+
     Valid destination arrays:
         [page /XYZ left top zoom]
         generally
         [page, PageLocationEntry, 0 to 4 ints]
     """
 
+    # Documents can have many thousands of outline items
+    __slots__ = (
+        'title',
+        'destination',
+        'page_location',
+        'page_location_kwargs',
+        'action',
+        'obj',
+        'is_closed',
+        'children',
+        '__weakref__',
+    )
+
     def __init__(
         self,
         title: str,
@@ -219,7 +245,7 @@ class OutlineItem:
             obj: ``Dictionary`` object representing a single outline node.
         """
         title = str(obj.Title)
-        destination = obj.get(Name.Dest)
+        destination = obj.get(_DEST)
         if destination is not None and not isinstance(
             destination, (Array, String, Name)
         ):
@@ -227,7 +253,7 @@ class OutlineItem:
             raise OutlineStructureError(
                 f"Unexpected object type in Outline's /Dest: {destination!r}"
             )
-        action = obj.get(Name.A)
+        action = obj.get(_A)
         if action is not None and not isinstance(action, Dictionary):
             raise OutlineStructureError(
                 f"Unexpected object type in Outline's /A: {action!r}"
@@ -259,11 +285,11 @@ class OutlineItem:
                     **self.page_location_kwargs,
                 )
             obj.Dest = self.destination
-            if Name.A in obj:
+            if _A in obj:
                 del obj.A
         elif self.action is not None:
             obj.A = self.action
-            if Name.Dest in obj:
+            if _DEST in obj:
                 del obj.Dest
         return obj
 
@@ -350,7 +376,7 @@ class Outline:
                 out_obj.Prev = prev
             else:
                 first = out_obj
-                if Name.Prev in out_obj:
+                if _PREV in out_obj:
                     del out_obj.Prev
             prev = out_obj
             if level < self._max_depth:
@@ -364,52 +390,58 @@ class Outline:
                 count += cast(int, out_obj.Count)
         if count:
             assert prev is not None and first is not None
-            if Name.Next in prev:
+            if _NEXT in prev:
                 del prev.Next
             parent.First = first
             parent.Last = prev
         else:
-            if Name.First in parent:
+            if _FIRST in parent:
                 del parent.First
-            if Name.Last in parent:
+            if _LAST in parent:
                 del parent.Last
         parent.Count = count
 
     def _load_level_outline(
         self,
         first_obj: Dictionary,
-        outline_items: list[Object],
+        outline_items: list[OutlineItem],
         level: int,
         visited_objs: set[tuple[int, int]],
     ):
-        current_obj: Dictionary | None = first_obj
-        while current_obj:
-            objgen = current_obj.objgen
-            if objgen in visited_objs:
-                if self._strict:
+        # Walk the tree depth-first without recursing. Before descending into
+        # an item's children, the rest of its sibling chain is pushed onto the
+        # stack, to be resumed once the children are done.
+        stack: list[tuple[Dictionary | None, list[OutlineItem], int]] = [
+            (first_obj, outline_items, level)
+        ]
+        while stack:
+            current_obj, items, depth = stack.pop()
+            while current_obj:
+                objgen = current_obj.objgen
+                if objgen in visited_objs:
+                    if self._strict:
+                        raise OutlineStructureError(
+                            f"Outline object {objgen} reoccurred in structure"
+                        )
+                    break
+                visited_objs.add(objgen)
+
+                item = OutlineItem.from_dictionary_object(current_obj)
+                items.append(item)
+                next_obj = current_obj.get(_NEXT)
+                if not (next_obj is None or isinstance(next_obj, Dictionary)):
                     raise OutlineStructureError(
-                        f"Outline object {objgen} reoccurred in structure"
+                        f"Outline object {objgen} points to non-dictionary"
                     )
-                return
-            visited_objs.add(objgen)
-
-            item = OutlineItem.from_dictionary_object(current_obj)
-            first_child = current_obj.get(Name.First)
-            if isinstance(first_child, Dictionary) and level < self._max_depth:
-                self._load_level_outline(
-                    first_child, item.children, level + 1, visited_objs
-                )
-                count = current_obj.get(Name.Count)
-                if isinstance(count, int) and count < 0:
-                    item.is_closed = True
-            outline_items.append(item)
-            next_obj = current_obj.get(Name.Next)
-            if next_obj is None or isinstance(next_obj, Dictionary):
-                current_obj = next_obj
-            else:
-                raise OutlineStructureError(
-                    f"Outline object {objgen} points to non-dictionary"
-                )
+                first_child = current_obj.get(_FIRST)
+                if isinstance(first_child, Dictionary) and depth < self._max_depth:
+                    count = current_obj.get(_COUNT)
+                    if isinstance(count, int) and count < 0:
+                        item.is_closed = True
+                    stack.append((next_obj, items, depth))
+                    current_obj, items, depth = first_child, item.children, depth + 1
+                else:
+                    current_obj = next_obj
 
     def _save(self):
         if self._root is None:
@@ -427,7 +459,7 @@ class Outline:
         if Name.Outlines not in self._pdf.Root:
             return
         outlines = self._pdf.Root.Outlines or {}
-        first_obj = outlines.get(Name.First)
+        first_obj = outlines.get(_FIRST)
         if first_obj:
             self._load_level_outline(first_obj, root, 0, set())
 
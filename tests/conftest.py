@@ -18,16 +18,59 @@ except ImportError:
 
 
 import pytest
+from hypothesis import settings
 
 TESTS_ROOT = os.path.abspath(os.path.dirname(__file__))
 PROJECT_ROOT = os.path.dirname(TESTS_ROOT)
 
+# Select with pytest --hypothesis-profile=fast (or thorough). Tests that set
+# their own max_examples keep it under any profile.
+settings.register_profile('fast', max_examples=25, deadline=None)
+settings.register_profile('thorough', max_examples=500, deadline=None)
+
 
 @pytest.fixture(scope="session")
 def resources():
     return Path(TESTS_ROOT) / 'resources'
 
 
+@pytest.fixture(scope="session")
+def resource_bytes(resources):
+    # Read each test file from disk once. Fixtures that modify a PDF open a
+    # fresh copy from these bytes, which is still fully independent.
+    cache: dict[str, bytes] = {}
+
+    def read(name: str) -> bytes:
+        if name not in cache:
+            cache[name] = (resources / name).read_bytes()
+        return cache[name]
+
+    return read
+
+
+@pytest.fixture(scope="session")
+def graph_readonly(resources):
+    # The *_readonly fixtures are shared by every module in the session, so
+    # tests that modify the PDF must open their own copy
+    from pikepdf import Pdf
+
+    with Pdf.open(resources / 'graph.pdf') as pdf:
+        yield pdf
+
+
+@pytest.fixture(scope="session")
+def sandwich_readonly(resources):
+    from pikepdf import Pdf
+
+    with Pdf.open(resources / 'sandwich.pdf') as pdf:
+        yield pdf
+
+
+@pytest.fixture(scope="session")
+def np():
+    return pytest.importorskip('numpy')
+
+
 @pytest.fixture(scope="function")
 def outdir(tmp_path):
     return tmp_path
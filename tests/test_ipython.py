@@ -8,7 +8,7 @@ Test IPython/Jupyter display hooks
 from __future__ import annotations
 
 import subprocess
-from io import BytesIO
+from pathlib import Path
 
 import pytest
 from conftest import fails_if_no_mutool
@@ -54,8 +54,12 @@ def test_draw_page(pal, monkeypatch):
     ), "Generated image/png when mudraw() was rigged to fail"
 
     def return_simple_svg(prog_args, *args, **kwargs):
-        bio = BytesIO(b'<svg xmlns="http://www.w3.org/2000/svg"></svg>')
-        return subprocess.CompletedProcess(prog_args, 0, stdout=bio.read(), stderr=b'')
+        svg = b'<svg xmlns="http://www.w3.org/2000/svg"></svg>'
+        output = prog_args[prog_args.index('-o') + 1]
+        if output == '-':
+            return subprocess.CompletedProcess(prog_args, 0, stdout=svg, stderr=b'')
+        Path(output).write_bytes(svg)
+        return subprocess.CompletedProcess(prog_args, 0, stdout=b'', stderr=b'')
 
     monkeypatch.setattr(pikepdf._methods, 'run', return_simple_svg)
     mimebundle = page0._repr_mimebundle_(
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Callable
 
 import pytest
+from PIL import Image
 
 import pikepdf
 from pikepdf import (
@@ -93,6 +94,49 @@ def test_jbig2_not_available(jbig2: Any, patch_jbig2dec: Callable[..., None]):
         pim.as_pil_image()
 
 
+def test_jbig2_version_probed_once():
+    calls = []
+
+    def run_version(args, *pargs, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout='0.20', stderr='')
+
+    decoder = JBIG2Decoder(subprocess_run=run_version)
+    assert decoder.available()
+    assert decoder.available()
+    decoder.check_available()
+    assert len(calls) == 1
+
+
+def test_jbig2_decode_cached():
+    calls = []
+
+    def run_fake_decode(args, *pargs, **kwargs):
+        calls.append(args)
+        output = Path(args[args.index('--output') + 1])
+        Image.new('1', (8, 1)).save(output, format='PNG')
+        return subprocess.CompletedProcess(args, 0)
+
+    decoder = JBIG2Decoder(subprocess_run=run_fake_decode, cache_size=8)
+    decoded = decoder.decode_jbig2(b'image', b'globals')
+    assert decoder.decode_jbig2(b'image', b'globals') == decoded
+    assert len(calls) == 1
+
+    decoder.decode_jbig2(b'image', b'')
+    decoder.decode_jbig2(b'globalsimage', b'')
+    assert len(calls) == 3
+
+    decoder.clear_cache()
+    decoder.decode_jbig2(b'image', b'globals')
+    assert len(calls) == 4
+
+    # Caching is opt-in
+    uncached = JBIG2Decoder(subprocess_run=run_fake_decode)
+    uncached.decode_jbig2(b'image', b'globals')
+    uncached.decode_jbig2(b'image', b'globals')
+    assert len(calls) == 6
+
+
 needs_jbig2dec = pytest.mark.skipif(
     not pikepdf.jbig2.get_decoder().available(), reason="jbig2dec not installed"
 )
@@ -56,7 +56,7 @@ def test_job_in_stages(resources, outpdf):
         assert len(pdf.pages) == 1
 
 
-def test_job_from_invalid_json():
+def test_job_from_invalid_json(resources):
     job_json = {}
     job_json['invalidJsonSetting'] = '123'
     with pytest.raises(RuntimeError):
@@ -67,6 +67,10 @@ def test_job_from_invalid_json():
     with pytest.raises(JobUsageError):
         _ = Job(job_json2)
 
+    job_json3 = {'inputFile': str(resources / 'outlines.pdf')}
+    with pytest.raises(JobUsageError, match='output file'):
+        _ = Job(job_json3)
+
 
 def test_schemas():
     assert isinstance(Job.LATEST_JSON, int)
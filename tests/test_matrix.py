@@ -89,14 +89,32 @@ class TestMatrix:
         with pytest.raises(ValueError, match='not invertible'):
             m.inverse()
 
-    def test_numpy(self):
-        np = pytest.importorskip('numpy')
-
+    def test_numpy(self, np):
         m = Matrix(1, 0, 0, 2, 7, 0)
         a = np.array([[1, 0, 0], [0, 2, 0], [7, 0, 1]])
         arr = np.array(m)
         assert np.array_equal(arr, a)
 
+    def test_numpy_asarray(self, np):
+        m = Matrix(1, 2, 3, 4, 5, 6)
+        iface = m.__array_interface__
+        assert iface['version'] == 3
+        assert iface['shape'] == (3, 3)
+        assert iface['typestr'][1:] == 'f8'
+
+        class InterfaceOnly:
+            __array_interface__ = iface
+
+        expected = [[1, 2, 0], [3, 4, 0], [5, 6, 1]]
+        assert np.array_equal(np.asarray(InterfaceOnly()), expected)
+
+        arr = np.asarray(m)
+        assert arr.dtype == np.float64
+        assert arr.shape == (3, 3)
+        assert np.array_equal(arr, expected)
+        arr[0, 0] = 42
+        assert m.a == 1
+
     def test_bool(self):
         with pytest.raises(ValueError):
             bool(Matrix(1, 0, 0, 1, 0, 0))
@@ -16,6 +16,12 @@ def outline(resources):
         yield pdf
 
 
+@pytest.fixture(scope="module")
+def outline_readonly(resources):
+    with Pdf.open(resources / 'outlines.pdf') as pdf:
+        yield pdf
+
+
 def test_nametree_crud(outline):
     nt = NameTree(outline.Root.Names.Dests)
     assert nt.obj == outline.Root.Names.Dests
@@ -38,17 +44,17 @@ def test_nametree_crud(outline):
     nt.update(foo='bar')
 
 
-def test_nametree_missing(outline):
-    nt = NameTree(outline.Root.Names.Dests)
+def test_nametree_missing(outline_readonly):
+    nt = NameTree(outline_readonly.Root.Names.Dests)
     with pytest.raises(KeyError):
         nt['does_not_exist']  # pylint: disable=pointless-statement
     with pytest.raises(KeyError):
         del nt['does_not_exist']
 
 
-def test_nametree_iter(outline):
+def test_nametree_iter(outline_readonly):
     count = 0
-    nt = NameTree(outline.Root.Names.Dests)
+    nt = NameTree(outline_readonly.Root.Names.Dests)
     for name in nt:
         count += 1
         assert name in nt
@@ -56,7 +62,7 @@ def test_nametree_iter(outline):
 
     assert '1' in nt.keys()
     assert len(nt.keys()) == len(nt.values()) == len(nt.items())
-    assert nt == NameTree(outline.Root.Names.Dests)
+    assert nt == NameTree(outline_readonly.Root.Names.Dests)
 
 
 def test_nametree_without_pdf():
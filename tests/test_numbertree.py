@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from io import BytesIO
+
 import pytest
 
 from pikepdf import Array, Dictionary, Name, NumberTree, Pdf
@@ -10,8 +12,8 @@ from pikepdf import Array, Dictionary, Name, NumberTree, Pdf
 # pylint: disable=redefined-outer-name
 
 
-@pytest.fixture
-def pagelabels_pdf():
+@pytest.fixture(scope="module")
+def pagelabels_bytes():
     with Pdf.new() as pdf:
         for _ in range(5):
             pdf.add_blank_page()
@@ -29,6 +31,14 @@ def pagelabels_pdf():
                 )
             )
         )
+        buf = BytesIO()
+        pdf.save(buf)
+        return buf.getvalue()
+
+
+@pytest.fixture
+def pagelabels_pdf(pagelabels_bytes):
+    with Pdf.open(BytesIO(pagelabels_bytes)) as pdf:
         yield pdf
 
 
@@ -7,14 +7,13 @@ import json
 import sys
 from copy import copy
 from decimal import Decimal, InvalidOperation
-from math import isclose, isfinite
+from math import isclose
 from zlib import compress
 
 import pytest
 from conftest import skip_if_pypy
-from hypothesis import assume, example, given
+from hypothesis import example, given, settings
 from hypothesis.strategies import (
-    binary,
     booleans,
     characters,
     floats,
@@ -41,6 +40,10 @@ from pikepdf.models import parse_content_stream
 
 encode = core._encode
 
+COMPRESSED_DEF = compress(b'def')
+COMPRESSED_FOO = compress(b'foo')
+DOUBLE_COMPRESSED = compress(compress(b'pointless'))
+
 
 def test_none():
     assert encode(None) is None
@@ -51,28 +54,42 @@ def test_booleans():
     assert encode(False) == False  # noqa: E712
 
 
-@given(characters(min_codepoint=0x20, max_codepoint=0x7F))
-@example('')
-def test_ascii_involution(ascii_):
-    b = ascii_.encode('ascii')
-    assert encode(b) == b
+def test_ascii_involution():
+    # Printable ASCII is small enough to check every character
+    for ascii_ in ['', *map(chr, range(0x20, 0x80))]:
+        b = ascii_.encode('ascii')
+        assert encode(b) == b
 
 
+@settings(max_examples=25, deadline=None)
 @given(
     characters(min_codepoint=0x0, max_codepoint=0xFEF0, blacklist_categories=('Cs',))
 )
 @example('')
+@example('\x00')
+@example('é')
+@example('中')
 def test_unicode_involution(s):
     assert str(encode(s)) == s
 
 
+@settings(max_examples=25, deadline=None)
 @given(characters(whitelist_categories=('Cs',)))
 def test_unicode_fails(s):
     with pytest.raises(UnicodeEncodeError):
         encode(s)
 
 
-@given(binary(min_size=0, max_size=300))
+@pytest.mark.parametrize(
+    'binary_',
+    [
+        b'',
+        b'\x00',
+        b'\xff' * 64,
+        b'(unbalanced\\',
+        bytes(range(256)),
+    ],
+)
 def test_binary_involution(binary_):
     assert bytes(encode(binary_)) == binary_
 
@@ -80,7 +97,12 @@ def test_binary_involution(binary_):
 int64s = integers(min_value=-9223372036854775807, max_value=9223372036854775807)
 
 
+@settings(max_examples=25, deadline=None)
 @given(int64s, int64s)
+@example(0, 0)
+@example(-1, 1)
+@example(42, 42)
+@example(9223372036854775807, -9223372036854775807)
 def test_integer_comparison(a, b):
     equals = a == b
     encoded_equals = encode(a) == encode(b)
@@ -91,35 +113,39 @@ def test_integer_comparison(a, b):
     assert lessthan == encoded_lessthan
 
 
-@given(integers(-(10**12), 10**12), integers(0, 12))
-def test_decimal_involution(num, radix):
-    strnum = str(num)
-    if radix > len(strnum):
-        strnum = strnum[:radix] + '.' + strnum[radix:]
-
+@pytest.mark.parametrize(
+    'strnum',
+    ['0', '1', '-1', '42.', '0.5', '-0.125', '3.14159', '-1000000000000'],
+)
+def test_decimal_involution(strnum):
     d = Decimal(strnum)
     assert encode(d) == d
 
 
-@given(floats())
+@settings(max_examples=40, deadline=None)
+@given(floats(allow_nan=False, allow_infinity=False, min_value=-1e12, max_value=1e12))
 def test_decimal_from_float(f):
     d = Decimal(f)
-    if isfinite(f) and d.is_finite():
-        try:
-            # PDF is limited to ~5 sig figs
-            decstr = str(d.quantize(Decimal('1.000000')))
-        except InvalidOperation:
-            return  # PDF doesn't support exponential notation
-        try:
-            py_d = Object.parse(decstr.encode('pdfdoc'))
-        except RuntimeError as e:
-            if 'overflow' in str(e) or 'underflow' in str(e):
-                py_d = Object.parse(f.encode('pdfdoc'))
-
-        assert isclose(py_d, d, abs_tol=1e-5), (d, f.hex())
-    else:
-        with pytest.raises(TypeError):
-            Object.parse(str(d))
+    try:
+        # PDF is limited to ~5 sig figs
+        decstr = str(d.quantize(Decimal('1.000000')))
+    except InvalidOperation:
+        return  # PDF doesn't support exponential notation
+    try:
+        py_d = Object.parse(decstr.encode('pdfdoc'))
+    except RuntimeError as e:
+        if 'overflow' in str(e) or 'underflow' in str(e):
+            py_d = Object.parse(f.encode('pdfdoc'))
+
+    assert isclose(py_d, d, abs_tol=1e-5), (d, f.hex())
+
+
+@pytest.mark.parametrize('f', [float('nan'), float('inf'), float('-inf')])
+def test_decimal_from_nonfinite_float(f):
+    d = Decimal(f)
+    assert not d.is_finite()
+    with pytest.raises(TypeError):
+        Object.parse(str(d))
 
 
 def test_qpdf_real_to_decimal():
@@ -134,11 +160,18 @@ def test_qpdf_real_to_decimal():
 )
 def test_stack_depth():
     a = [42]
-    for _ in range(100):
+    for _ in range(50):
         a = [a]
+    # Allow fewer frames above the current stack depth than the list is deep,
+    # rather than relying on pytest's own stack to use up a fixed limit
+    depth = 0
+    frame = sys._getframe()
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
     rlimit = sys.getrecursionlimit()
     try:
-        sys.setrecursionlimit(100)
+        sys.setrecursionlimit(depth + 25)
         with pytest.raises(RecursionError):
             assert encode(a) == a
         with pytest.raises(RecursionError):
@@ -163,6 +196,17 @@ def test_bytes():
         Name(b'/bytes')
 
 
+nested_lists = lists(
+    recursive(
+        integers(1, 10) | booleans(),
+        lambda children: lists(children),  # pylint: disable=unnecessary-lambda
+        max_leaves=10,
+    ),
+    min_size=1,
+    max_size=5,
+)
+
+
 class TestArray:
     def test_len_array(self):
         assert len(Array([])) == 0
@@ -173,11 +217,13 @@ class TestArray:
         assert Name('/Foo').wrap_in_array() == Array([Name('/Foo')])
         assert Array([42]).wrap_in_array() == Array([42])
 
+    @settings(max_examples=25, deadline=None)
     @given(lists(integers(-10, 10), min_size=0, max_size=10))
     def test_list(self, array):
         a = pikepdf.Array(array)
         assert a == array
 
+    @settings(max_examples=25, deadline=None)
     @given(
         lists(lists(integers(1, 10), min_size=1, max_size=5), min_size=1, max_size=5)
     )
@@ -185,15 +231,9 @@ class TestArray:
         a = pikepdf.Array(array)
         assert a == array
 
-    @given(
-        recursive(
-            integers(1, 10) | booleans(),
-            lambda children: lists(children),  # pylint: disable=unnecessary-lambda
-            max_leaves=20,
-        )
-    )
+    @settings(max_examples=25, deadline=None)
+    @given(nested_lists)
     def test_nested_list2(self, array):
-        assume(isinstance(array, list))
         a = pikepdf.Array(array)
         assert a == array
 
@@ -473,8 +513,10 @@ def test_not_convertible():
     assert d != c
 
 
-def test_json():
-    d = Dictionary(
+@pytest.fixture(scope="module")
+def sample_dict():
+    # Shared by tests that only read it
+    return Dictionary(
         {
             '/Boolean': True,
             '/Integer': 42,
@@ -484,7 +526,10 @@ def test_json():
             '/Dictionary': Dictionary({'/Color': 'Red'}),
         }
     )
-    json_bytes = d.to_json(False)
+
+
+def test_json(sample_dict):
+    json_bytes = sample_dict.to_json(False)
     as_dict = json.loads(json_bytes)
     assert as_dict == {
         "/Array": [1, 2, 3.14],
@@ -496,13 +541,18 @@ def test_json():
     }
 
 
+@pytest.fixture(scope="module")
+def stream_pdf():
+    # Each test makes its own Stream, so the owning Pdf can be shared
+    with pikepdf.new() as pdf:
+        yield pdf
+
+
 class TestStream:
     @pytest.fixture(scope="function")
-    def abcxyz_stream(self):
-        with pikepdf.new() as pdf:
-            data = b'abcxyz'
-            stream = Stream(pdf, data)
-            yield stream
+    def abcxyz_stream(self, stream_pdf):
+        data = b'abcxyz'
+        return Stream(stream_pdf, data)
 
     def test_stream_isinstance(self):
         pdf = pikepdf.new()
@@ -615,39 +665,42 @@ def sandwich(resources):
 
 class TestStreamReadWrite:
     @pytest.fixture
-    def stream_object(self):
-        with pikepdf.new() as pdf:
-            yield Stream(pdf, b'abc123xyz')
+    def stream_object(self, stream_pdf):
+        return Stream(stream_pdf, b'abc123xyz')
 
     def test_basic(self, stream_object):
         stream_object.write(b'abc')
         assert stream_object.read_bytes() == b'abc'
 
-    def test_compressed_readback(self, stream_object):
-        stream_object.write(compress(b'def'), filter=Name.FlateDecode)
-        assert stream_object.read_bytes() == b'def'
-
-    def test_stacked_compression(self, stream_object):
-        double_compressed = compress(compress(b'pointless'))
-        stream_object.write(
-            double_compressed, filter=[Name.FlateDecode, Name.FlateDecode]
-        )
-        assert stream_object.read_bytes() == b'pointless'
-        assert stream_object.read_raw_bytes() == double_compressed
-
-    def test_explicit_decodeparms(self, stream_object):
-        double_compressed = compress(compress(b'pointless'))
-        stream_object.write(
-            double_compressed,
-            filter=[Name.FlateDecode, Name.FlateDecode],
-            decode_parms=[None, None],
-        )
-        assert stream_object.read_bytes() == b'pointless'
-        assert stream_object.read_raw_bytes() == double_compressed
+    @pytest.mark.parametrize(
+        'raw, filter_, decode_parms, expected',
+        [
+            (COMPRESSED_DEF, Name.FlateDecode, None, b'def'),
+            (
+                DOUBLE_COMPRESSED,
+                [Name.FlateDecode, Name.FlateDecode],
+                None,
+                b'pointless',
+            ),
+            (
+                DOUBLE_COMPRESSED,
+                [Name.FlateDecode, Name.FlateDecode],
+                [None, None],
+                b'pointless',
+            ),
+        ],
+        ids=['single', 'stacked', 'explicit_decodeparms'],
+    )
+    def test_compressed_readback(
+        self, stream_object, raw, filter_, decode_parms, expected
+    ):
+        stream_object.write(raw, filter=filter_, decode_parms=decode_parms)
+        assert stream_object.read_bytes() == expected
+        assert stream_object.read_raw_bytes() == raw
 
     def test_no_kwargs(self, stream_object):
         with pytest.raises(TypeError):
-            stream_object.write(compress(b'x'), [Name.FlateDecode])
+            stream_object.write(COMPRESSED_FOO, [Name.FlateDecode])
 
     def test_ccitt(self, stream_object):
         ccitt = b'\x00'  # Not valid data, just for testing decode_parms
@@ -668,13 +721,13 @@ class TestStreamReadWrite:
     def test_invalid_decodeparms(self, stream_object):
         with pytest.raises(TypeError, match="decode_parms must be"):
             stream_object.write(
-                compress(b'foo'), filter=Name.FlateDecode, decode_parms=[42]
+                COMPRESSED_FOO, filter=Name.FlateDecode, decode_parms=[42]
             )
 
     def test_filter_decodeparms_mismatch(self, stream_object):
         with pytest.raises(ValueError, match=r"filter.*and decode_parms"):
             stream_object.write(
-                compress(b'foo'),
+                COMPRESSED_FOO,
                 filter=[Name.FlateDecode],
                 decode_parms=[Dictionary(), Dictionary()],
             )
@@ -684,27 +737,17 @@ class TestStreamReadWrite:
         assert bytes(raw_buffer) == b'abc123xyz'
 
 
-def test_copy():
-    d = Dictionary(
-        {
-            '/Boolean': True,
-            '/Integer': 42,
-            '/Real': Decimal('42.42'),
-            '/String': String('hi'),
-            '/Array': Array([1, 2, 3.14]),
-            '/Dictionary': Dictionary({'/Color': 'Red'}),
-        }
-    )
-    d2 = copy(d)
-    assert d2 == d
-    assert d2 is not d
-    assert d2['/Dictionary'] == d['/Dictionary']
+def test_copy(sample_dict):
+    d2 = copy(sample_dict)
+    assert d2 == sample_dict
+    assert d2 is not sample_dict
+    assert d2['/Dictionary'] == sample_dict['/Dictionary']
 
 
-def test_object_iteration(sandwich):
-    expected = len(sandwich.objects)
+def test_object_iteration(sandwich_readonly):
+    expected = len(sandwich_readonly.objects)
     loops = 0
-    for obj in sandwich.objects:
+    for obj in sandwich_readonly.objects:
         loops += 1
         if isinstance(obj, Dictionary):
             assert len(obj.keys()) >= 1
@@ -760,8 +803,8 @@ class TestOperator:
         assert bool(Operator('')) is False
 
 
-def test_object_mapping(sandwich):
-    object_mapping = sandwich.pages[0].images
+def test_object_mapping(sandwich_readonly):
+    object_mapping = sandwich_readonly.pages[0].images
     assert '42' not in object_mapping
     assert '/R12' in object_mapping
     assert '/R12' in object_mapping.keys()
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import sys
+import weakref
+from io import BytesIO
 from itertools import repeat
 
 import pytest
@@ -30,6 +33,19 @@ def outlines_doc(resources):
         yield pdf
 
 
+# The Hypothesis tests below cannot use function-scoped fixtures, so they share
+# these instead of opening outlines.pdf for every example
+@pytest.fixture(scope="module")
+def outlines_doc_readonly(resources):
+    with Pdf.open(resources / 'outlines.pdf') as pdf:
+        yield pdf
+
+
+@pytest.fixture(scope="module")
+def outlines_bytes(resources):
+    return (resources / 'outlines.pdf').read_bytes()
+
+
 def test_load_outlines(outlines_doc):
     root_obj = outlines_doc.Root.Outlines
     first_obj = root_obj.First
@@ -162,6 +178,23 @@ def test_recursion_depth_one(outlines_doc):
         assert '/Last' not in obj
 
 
+def test_load_deeper_than_recursion_limit():
+    depth = sys.getrecursionlimit() + 100
+    with Pdf.new() as pdf:
+        pdf.Root.Outlines = parent = pdf.make_indirect(Dictionary(Type=Name.Outlines))
+        for level in range(depth):
+            child = pdf.make_indirect(Dictionary(Title=f'Level {level}'))
+            parent.First = parent.Last = child
+            parent = child
+
+        outline = pdf.open_outline(max_depth=depth)
+        item = outline.root[0]
+        for _ in range(depth - 1):
+            item = item.children[0]
+        assert item.title == f'Level {depth - 1}'
+        assert not item.children
+
+
 def test_reference_loop_on_level(outlines_doc):
     root_obj = outlines_doc.Root.Outlines
     first_obj = root_obj.First
@@ -404,39 +437,37 @@ def test_dest_or_action(outlines_doc):
     page_loc='FitR',
     kwargs={'left': 0, 'top': 0, 'bottom': 0, 'right': 0, 'zoom': 0},
 )
-def test_page_destination(resources, page_num, page_loc, kwargs):
-    # @given precludes use of outlines_doc fixture - causes hypothesis health check to
-    # fail
-    with Pdf.open(resources / 'outlines.pdf') as doc:
-        page_ref = doc.pages[page_num]
-
-        if page_loc == 'invalid':
-            with pytest.raises(ValueError, match='unsupported page location'):
-                make_page_destination(doc, page_num, page_loc, **kwargs)
-            return
-
-        dest = make_page_destination(doc, page_num, page_loc, **kwargs)
-        if isinstance(page_loc, PageLocation):
-            loc_str = page_loc.name
-        else:
-            loc_str = page_loc
-        if loc_str == 'XYZ':
-            args = 'left', 'top', 'zoom'
-        elif loc_str == 'FitH':
-            args = ('top',)
-        elif loc_str == 'FitV':
-            args = ('left',)
-        elif loc_str == 'FitR':
-            args = 'left', 'bottom', 'right', 'top'
-        elif loc_str == 'FitBH':
-            args = ('top',)
-        elif loc_str == 'FitBV':
-            args = ('left',)
-        else:
-            args = ()
-        expected_dest = [page_ref.obj, Name(f'/{loc_str}')]
-        expected_dest.extend(kwargs.get(k, 0) for k in args)
-        assert dest == expected_dest
+def test_page_destination(outlines_doc_readonly, page_num, page_loc, kwargs):
+    doc = outlines_doc_readonly
+    page_ref = doc.pages[page_num]
+
+    if page_loc == 'invalid':
+        with pytest.raises(ValueError, match='unsupported page location'):
+            make_page_destination(doc, page_num, page_loc, **kwargs)
+        return
+
+    dest = make_page_destination(doc, page_num, page_loc, **kwargs)
+    if isinstance(page_loc, PageLocation):
+        loc_str = page_loc.name
+    else:
+        loc_str = page_loc
+    if loc_str == 'XYZ':
+        args = 'left', 'top', 'zoom'
+    elif loc_str == 'FitH':
+        args = ('top',)
+    elif loc_str == 'FitV':
+        args = ('left',)
+    elif loc_str == 'FitR':
+        args = 'left', 'bottom', 'right', 'top'
+    elif loc_str == 'FitBH':
+        args = ('top',)
+    elif loc_str == 'FitBV':
+        args = ('left',)
+    else:
+        args = ()
+    expected_dest = [page_ref.obj, Name(f'/{loc_str}')]
+    expected_dest.extend(kwargs.get(k, 0) for k in args)
+    assert dest == expected_dest
 
 
 @settings(deadline=60000)
@@ -455,10 +486,8 @@ def test_page_destination(resources, page_num, page_loc, kwargs):
     page_num=0,
     page_loc=PageLocation.XYZ,
 )
-def test_new_item(resources, title, page_num, page_loc):
-    # @given precludes use of outlines_doc fixture - causes hypothesis health check to
-    # fail
-    with Pdf.open(resources / 'outlines.pdf') as doc:
+def test_new_item(outlines_bytes, title, page_num, page_loc):
+    with Pdf.open(BytesIO(outlines_bytes)) as doc:
         kwargs = dict.fromkeys(ALL_PAGE_LOCATION_KWARGS, 100)
         page_ref = doc.pages[page_num]
 
@@ -506,6 +535,13 @@ def test_outline_repr(outlines_doc):
         assert repr(outline.root[0]).startswith('<pikepdf.OutlineItem')
 
 
+def test_outlineitem_attributes():
+    item = OutlineItem('Weak')
+    assert weakref.ref(item)() is item
+    with pytest.raises(AttributeError):
+        item.not_an_attribute = True
+
+
 def test_outline_destination_name_object_types():
     # See issues 258, 261
     obj = Dictionary(Title='foo', Dest=Name.Bar)
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import gc
 from contextlib import suppress
+from io import BytesIO
 from shutil import copy
 
 import pytest
@@ -16,20 +17,20 @@ from pikepdf._cpphelpers import label_from_label_dict
 
 
 @pytest.fixture
-def graph(resources):
-    with Pdf.open(resources / 'graph.pdf') as pdf:
+def graph(resource_bytes):
+    with Pdf.open(BytesIO(resource_bytes('graph.pdf'))) as pdf:
         yield pdf
 
 
 @pytest.fixture
-def fourpages(resources):
-    with Pdf.open(resources / 'fourpages.pdf') as pdf:
+def fourpages(resource_bytes):
+    with Pdf.open(BytesIO(resource_bytes('fourpages.pdf'))) as pdf:
         yield pdf
 
 
 @pytest.fixture
-def sandwich(resources):
-    with Pdf.open(resources / 'sandwich.pdf') as pdf:
+def sandwich(resource_bytes):
+    with Pdf.open(BytesIO(resource_bytes('sandwich.pdf'))) as pdf:
         yield pdf
 
 
@@ -249,13 +250,15 @@ def test_negative_indexing(fourpages, graph):
         del fourpages.pages[-42]
 
 
-def test_concatenate(resources, outdir):
-    # Issue #22
+def test_concatenate(resource_bytes, outdir):
+    # Issue #22: each source is closed before output_pdf is saved
+    pal = resource_bytes('pal.pdf')
+
     def concatenate(n):
         output_pdf = Pdf.new()
         for i in range(n):
             print(i)
-            with Pdf.open(resources / 'pal.pdf') as pdf_page:
+            with Pdf.open(BytesIO(pal)) as pdf_page:
                 output_pdf.pages.extend(pdf_page.pages)
         output_pdf.save(outdir / f'{n}.pdf')
 
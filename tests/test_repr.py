@@ -7,13 +7,34 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from hypothesis import example, given
+from hypothesis import example, given, settings
 from hypothesis.strategies import binary
 
 import pikepdf
 from pikepdf import Array, Dictionary, Name, Operator, String
 
 
+def _strip_all_whitespace(s):
+    return ''.join(s.split())
+
+
+_EXPECTED_DICT_REPR = _strip_all_whitespace(
+    """\
+    pikepdf.Dictionary({
+        "/Array": [ 1, 2, Decimal('3.14') ],
+        "/Boolean": True,
+        "/Dictionary": {
+            "/Color": "Red"
+        },
+        "/Integer": 42,
+        "/Operator": pikepdf.Operator("q"),
+        "/Real": Decimal('42.42'),
+        "/String": "hi"
+    })
+    """
+)
+
+
 def test_repr_dict():
     d = Dictionary(
         {
@@ -26,28 +47,7 @@ def test_repr_dict():
             '/Dictionary': Dictionary({'/Color': 'Red'}),
         }
     )
-    short_pi = '3.14'
-    expected = (
-        """\
-        pikepdf.Dictionary({
-            "/Array": [ 1, 2, Decimal('%s') ],
-            "/Boolean": True,
-            "/Dictionary": {
-                "/Color": "Red"
-            },
-            "/Integer": 42,
-            "/Operator": pikepdf.Operator("q"),
-            "/Real": Decimal('42.42'),
-            "/String": "hi"
-        })
-    """
-        % short_pi
-    )
-
-    def strip_all_whitespace(s):
-        return ''.join(s.split())
-
-    assert strip_all_whitespace(repr(d)) == strip_all_whitespace(expected)
+    assert _strip_all_whitespace(repr(d)) == _EXPECTED_DICT_REPR
     assert eval(repr(d)) == d
 
 
@@ -64,10 +64,9 @@ def test_repr_scalar():
         assert eval(repr(s)) == s
 
 
-def test_repr_indirect(resources):
-    with pikepdf.open(resources / 'graph.pdf') as graph:
-        repr_page0 = repr(graph.pages[0])
-        assert repr_page0[0] == '<', 'should not be constructible'
+def test_repr_indirect(graph_readonly):
+    repr_page0 = repr(graph_readonly.pages[0])
+    assert repr_page0[0] == '<', 'should not be constructible'
 
 
 def test_repr_circular():
@@ -116,6 +115,7 @@ def dequote(s):
     return s.replace('"', '').replace("'", '')
 
 
+@settings(max_examples=25, deadline=None)
 @given(binary(min_size=0, max_size=300))
 @example(b'hi')
 @example(b'\x00\x00\x00\t \'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"')